@@ -1,3 +1,3 @@
-from .generator import generate_wifi_qr
+from .generator import generate_many, generate_wifi_qr
 
-__all__ = ["generate_wifi_qr"]
+__all__ = ["generate_many", "generate_wifi_qr"]
@@ -1,14 +1,149 @@
+# qrcode, PIL, dotenv and multiprocessing are imported where they are used, so
+# the CLI can parse arguments and report errors without paying for them.
+from __future__ import annotations
+
 import os
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-import qrcode
-from dotenv import load_dotenv
-from PIL import Image, ImageDraw, ImageFont
+
+if TYPE_CHECKING:
+    from typing import BinaryIO
+
+    from PIL import Image
+
+CANVAS_SIZE = (827, 920)
+
+IMAGE_FORMATS = ("JPEG", "PNG")
+
+# Large enough that a whole encoded image leaves in a single write
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+@lru_cache(maxsize=1)
+def _blank_canvas() -> Image.Image:
+    """Build the pre-filled white canvas; copying it is a single memcpy.
+
+    Returns:
+        Shared PIL Image object; callers must copy before drawing on it
+    """
+    from PIL import Image
+
+    return Image.new("RGB", CANVAS_SIZE, "white")
+
+
+@lru_cache(maxsize=8)
+def _load_font(path: str, size: int):
+    """Load a TrueType font once per (path, size), with fallback to default.
+
+    Args:
+        path: Path to the TrueType font file
+        size: Font size in points
+
+    Returns:
+        PIL ImageFont object
+    """
+    from PIL import ImageFont
+
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=64)
+def _render_text_mask(text: str, font) -> tuple[Image.Image, tuple[int, int]]:
+    """Rasterize a line of text into an alpha mask once per font and text.
+
+    Args:
+        text: Text to render
+        font: PIL ImageFont object to render with
+
+    Returns:
+        Tuple of (mask, offset), where offset is the mask's top-left corner
+        relative to the text origin
+    """
+    from PIL import Image, ImageDraw
+
+    left, top, right, bottom = font.getbbox(text)
+    mask = Image.new("L", (right - left, bottom - top))
+    ImageDraw.Draw(mask).text((-left, -top), text, fill=255, font=font)
+    return mask, (left, top)
+
+
+def _infer_format(output_path: str) -> str:
+    """Infer the image format from the output file suffix.
+
+    Args:
+        output_path: Path where the image will be saved
+
+    Returns:
+        "PNG" for .png files, "JPEG" otherwise
+    """
+    return "PNG" if Path(output_path).suffix.lower() == ".png" else "JPEG"
+
+
+def _encode_qr_matrix(data: str):
+    """Encode data into a QR module matrix.
+
+    Args:
+        data: Payload to encode
+
+    Returns:
+        Rows of modules (truthy for dark), without quiet zone
+    """
+    import qrcode
+
+    # Pin the mask so qrcode skips scoring all eight candidate masks
+    qr = qrcode.QRCode(border=0, mask_pattern=0)
+    qr.add_data(data)
+    qr.make(fit=True)
+    return qr.get_matrix()
+
+
+# Maps a light (0) module byte to white and any dark (non-zero) one to black
+_MODULE_TO_PIXEL = bytes([255] + [0] * 255)
+
+
+def _matrix_to_image(matrix, box_size: int) -> Image.Image:
+    """Rasterize a QR module matrix into a black-on-white image.
+
+    The quiet zone is not drawn; callers paste the result onto a white canvas
+    with the border offset applied.
+
+    Args:
+        matrix: Rows of modules (True for dark), without quiet zone
+        box_size: Pixels per module
+
+    Returns:
+        PIL Image object of mode "L"
+    """
+    from PIL import Image
+
+    size = len(matrix)
+    data = b"".join(bytes(row) for row in matrix).translate(_MODULE_TO_PIXEL)
+
+    modules = Image.frombytes("L", (size, size), data)
+    return modules.resize((size * box_size, size * box_size), Image.Resampling.NEAREST)
 
 
 class WiFiQRGenerator:
     """Class for generating WiFi QR codes with text overlay."""
 
+    FONT_PATH = "/System/Library/Fonts/Arial.ttf"
+    FONT_SIZE = 40
+
+    _SSID_PREFIX = "ssid: "
+    _PW_PREFIX = "password: "
+
+    # Attributes __init__ sets; anything else on an instance is an override
+    # the shared render cache cannot see
+    _INIT_ATTRS = frozenset(
+        ("_ssid", "_password", "_encryption", "_encoded", "_ssid_line", "_pw_line")
+    )
+
     def __init__(self, ssid: str, password: str, encryption: str = "WPA"):
         """Initialize the WiFi QR generator.
 
@@ -24,9 +159,31 @@ class WiFiQRGenerator:
             msg = "Password must be provided for encrypted networks"
             raise ValueError(msg)
 
-        self.ssid = ssid
-        self.password = password
-        self.encryption = encryption
+        self._ssid = ssid
+        self._password = password
+        self._encryption = encryption
+        self._encoded = (
+            "WIFI:S:" + ssid + ";T:" + encryption + ";P:" + (password or "") + ";;"
+        )
+        self._ssid_line = self._SSID_PREFIX + ssid
+        self._pw_line = self._PW_PREFIX + (password or "(no password)")
+
+    # Credentials are read-only: the payload and overlay lines derived from
+    # them in __init__ would otherwise go stale.
+    @property
+    def ssid(self) -> str:
+        """WiFi network name."""
+        return self._ssid
+
+    @property
+    def password(self) -> str:
+        """WiFi password (None for open networks)."""
+        return self._password
+
+    @property
+    def encryption(self) -> str:
+        """Encryption type (WPA, WEP, nopass)."""
+        return self._encryption
 
     def encode_wifi_string(self) -> str:
         """Encode WiFi credentials into QR code string format.
@@ -34,10 +191,9 @@ class WiFiQRGenerator:
         Returns:
             WiFi string in format: WIFI:S:<SSID>;T:<ENCRYPTION>;P:<PASSWORD>;;
         """
-        password_str = self.password if self.password is not None else ""
-        return f"WIFI:S:{self.ssid};T:{self.encryption};P:{password_str};;"
+        return self._encoded
 
-    def generate_text_overlay(self, qr_y_position: int, qr_height: int) -> list:
+    def generate_text_overlay(self, qr_y_position: int, qr_height: int) -> tuple:
         """Generate text overlay data for the QR code image.
 
         Args:
@@ -45,41 +201,53 @@ class WiFiQRGenerator:
             qr_height: Height of the QR code
 
         Returns:
-            List of tuples containing (position, text) for drawing
+            Tuple of (position, text) pairs for drawing
         """
         text_y = qr_y_position + qr_height - 40
-        password_display = (
-            self.password if self.password is not None else "(no password)"
+        return (
+            ((90, text_y), self._ssid_line),
+            ((90, text_y + 50), self._pw_line),
         )
 
-        return [
-            ((90, text_y), f"ssid: {self.ssid}"),
-            ((90, text_y + 50), f"password: {password_display}"),
-        ]
-
     def create_image(self) -> Image.Image:
         """Create the complete QR code image with text overlay.
 
+        Images of plain WiFiQRGenerator instances are cached per (ssid,
+        password, encryption); each call returns a fresh copy so callers may
+        modify it freely. Subclasses and instances with overridden attributes
+        may render the same credentials differently, so they always render
+        afresh.
+
+        Returns:
+            PIL Image object containing QR code and text
+        """
+        if type(self) is not WiFiQRGenerator or vars(self).keys() != self._INIT_ATTRS:
+            return self._render()
+        return _cached_image(self.ssid, self.password, self.encryption).copy()
+
+    def _render(self) -> Image.Image:
+        """Render the QR code and text overlay onto a new canvas.
+
         Returns:
             PIL Image object containing QR code and text
         """
         # Generate QR code
+        box_size = 22
+        border = 4
         wifi_string = self.encode_wifi_string()
-        qr = qrcode.QRCode(box_size=22, border=4)
-        qr.add_data(wifi_string)
-        qr.make(fit=True)
-        qr_img = qr.make_image()
+        matrix = _encode_qr_matrix(wifi_string)
+        qr_img = _matrix_to_image(matrix, box_size=box_size)
 
         # Create canvas
-        canvas_width = 827
-        canvas_height = 920
-        canvas = Image.new("RGB", (canvas_width, canvas_height), "white")
+        canvas_width, _ = CANVAS_SIZE
+        canvas = _blank_canvas().copy()
 
-        # Paste QR code centered at top
-        qr_width, qr_height = qr_img.size
-        x = (canvas_width - qr_width) // 2
+        # Paste QR code centered at top. The canvas is already white, so the
+        # quiet zone is just an offset rather than extra pixels to copy.
+        qr_height = (len(matrix) + 2 * border) * box_size
+        x = (canvas_width - qr_height) // 2
         y = 20  # small margin from top
-        canvas.paste(qr_img, (x, y))
+        canvas.paste(qr_img, (x + border * box_size, y + border * box_size))
 
         # Add text overlay
         self._add_text_to_canvas(canvas, y, qr_height)
@@ -94,32 +262,102 @@ class WiFiQRGenerator:
             qr_y: Y position of QR code
             qr_height: Height of QR code
         """
-        draw = ImageDraw.Draw(canvas)
         font = self._get_font()
-
         text_data = self.generate_text_overlay(qr_y, qr_height)
-        for position, text in text_data:
-            draw.text(position, text, fill="black", font=font)
+        for (x, y), text in text_data:
+            mask, (left, top) = _render_text_mask(text, font)
+            canvas.paste("black", (x + left, y + top), mask)
 
     def _get_font(self):
         """Get font for text rendering, with fallback to default.
 
+        The font is loaded once per process and shared by all instances.
+
         Returns:
             PIL ImageFont object
         """
+        return _load_font(self.FONT_PATH, self.FONT_SIZE)
+
+    def save_image(
+        self,
+        image: Image.Image,
+        output_path: str | BinaryIO,
+        image_format: str | None = None,
+    ) -> str:
+        """Save the image to a file.
+
+        Args:
+            image: PIL Image object to save
+            output_path: Path where to save the image file, or a writable
+                binary file object such as io.BytesIO
+            image_format: Output format (JPEG, PNG, case-insensitive); inferred
+                from the output_path suffix when omitted, JPEG for file objects
+
+        Returns:
+            The format the image was written in (JPEG or PNG)
+
+        Raises:
+            ValueError: If image_format is not JPEG or PNG
+        """
+        is_file_object = hasattr(output_path, "write")
+        if image_format is None:
+            image_format = "JPEG" if is_file_object else _infer_format(output_path)
+        image_format = image_format.upper()
+        if image_format not in IMAGE_FORMATS:
+            msg = (
+                f"Invalid image format '{image_format}'. "
+                f"Must be one of: {', '.join(IMAGE_FORMATS)}"
+            )
+            raise ValueError(msg)
+
+        if is_file_object:
+            self._write_image(image, output_path, image_format)
+            return image_format
+
+        # Open outside the clean-up: if the open itself fails, whatever is
+        # already at the path is left alone.
+        path = Path(output_path)
+        fp = path.open("wb", buffering=_WRITE_BUFFER_SIZE)
         try:
-            return ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 40)
-        except OSError:
-            return ImageFont.load_default()
+            with fp:
+                self._write_image(image, fp, image_format)
+        except Exception:
+            path.unlink(missing_ok=True)
+            raise
+        return image_format
 
-    def save_image(self, image: Image.Image, output_path: str) -> None:
-        """Save the image to a file.
+    @staticmethod
+    def _write_image(image: Image.Image, fp: BinaryIO, image_format: str) -> None:
+        """Encode the image into an open binary file object.
 
         Args:
             image: PIL Image object to save
-            output_path: Path where to save the JPG file
+            fp: Writable binary file object
+            image_format: Output format (JPEG, PNG)
         """
-        image.save(output_path, "JPEG")
+        # The artwork is black on white, so a single luma plane loses nothing
+        # and skips chroma conversion and encoding entirely.
+        gray = image.convert("L")
+        if image_format == "PNG":
+            gray.save(fp, "PNG", optimize=False, compress_level=1)
+        else:
+            gray.save(fp, "JPEG", quality=85, optimize=False, progressive=False)
+
+
+# Each entry is a full RGB canvas (~2.3 MB), so keep only a handful
+@lru_cache(maxsize=8)
+def _cached_image(ssid: str, password: str, encryption: str) -> Image.Image:
+    """Render a WiFi QR image once per set of credentials.
+
+    Args:
+        ssid: WiFi network name
+        password: WiFi password (None for open networks)
+        encryption: Encryption type (WPA, WEP, nopass)
+
+    Returns:
+        Shared PIL Image object; callers must copy before handing it out
+    """
+    return WiFiQRGenerator(ssid, password, encryption)._render()
 
 
 def generate_wifi_qr(ssid: str, password: str, encryption: str = "WPA") -> Image.Image:
@@ -137,9 +375,59 @@ def generate_wifi_qr(ssid: str, password: str, encryption: str = "WPA") -> Image
     return generator.create_image()
 
 
+def _render_credentials(creds: tuple[str, str, str]) -> Image.Image:
+    """Render one set of credentials; module-level so worker processes can run it.
+
+    Args:
+        creds: (ssid, password, encryption) tuple
+
+    Returns:
+        PIL Image object containing QR code and text
+    """
+    return WiFiQRGenerator(*creds)._render()
+
+
+def generate_many(
+    credentials: list[tuple[str, str, str]], max_workers: int | None = 1
+) -> list[Image.Image]:
+    """Generate WiFi QR images for a batch of credentials.
+
+    Images are rendered directly rather than through the per-credentials
+    cache, so a large batch neither evicts hot entries nor pays for copies.
+    By default the batch is rendered in the calling process. QR encoding is
+    pure Python and holds the GIL, so large batches can opt into worker
+    processes with max_workers > 1. Pool startup costs tens of milliseconds,
+    so this only pays off for large batches. Under the "spawn" start method
+    (the default on macOS and Windows) the calling script must invoke this
+    from inside an ``if __name__ == "__main__":`` guard.
+
+    Args:
+        credentials: (ssid, password, encryption) tuples
+        max_workers: Number of worker processes; 1 (the default) renders
+            in the calling process, None uses one per CPU
+
+    Returns:
+        List of PIL Image objects, in the same order as credentials
+    """
+    credentials = list(credentials)
+    workers = min(max_workers or os.cpu_count() or 1, len(credentials))
+    if workers <= 1:
+        return [_render_credentials(creds) for creds in credentials]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = max(1, len(credentials) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_render_credentials, credentials, chunksize=chunksize))
+
+
 @click.command()
 @click.option(
-    "--output", "-o", type=click.Path(), required=True, help="Output file for the JPG."
+    "--output",
+    "-o",
+    type=click.Path(),
+    required=True,
+    help="Output file for the image (.jpg or .png).",
 )
 @click.option("--ssid", "-s", envvar="WIFI_SSID", help="WiFi network name.")
 @click.option("--password", "-p", envvar="WIFI_PASSWORD", help="WiFi password.")
@@ -150,8 +438,17 @@ def generate_wifi_qr(ssid: str, password: str, encryption: str = "WPA") -> Image
     default="WPA",
     help="WiFi encryption type (WPA, WEP, nopass).",
 )
-def main(output, ssid, password, encryption):
-    """Generate WiFi QR code JPG from environment variables or command line options."""
+@click.option(
+    "--format",
+    "-f",
+    "image_format",
+    type=click.Choice(IMAGE_FORMATS, case_sensitive=False),
+    help="Image format (JPEG, PNG). Inferred from the output suffix by default.",
+)
+def main(output, ssid, password, encryption, image_format):
+    """Generate WiFi QR code image from environment variables or command line options."""
+    from dotenv import load_dotenv
+
     load_dotenv()
 
     # Use environment variables if CLI options not provided
@@ -189,8 +486,9 @@ def main(output, ssid, password, encryption):
     try:
         generator = WiFiQRGenerator(ssid, password, encryption)
         img = generator.create_image()
-        generator.save_image(img, output)
-        click.echo(f"JPG saved to {output}")
+        saved_format = generator.save_image(img, output, image_format)
+        label = "JPG" if saved_format == "JPEG" else saved_format
+        click.echo(f"{label} saved to {output}")
     except ValueError as e:
         click.echo(f"Error: {e}", err=True)
         raise click.Exit(1) from None
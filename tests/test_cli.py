@@ -1,10 +1,34 @@
+import io
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 from click.testing import CliRunner
-
-from wifiqr.generator import WiFiQRGenerator, generate_wifi_qr, main
+from PIL import Image, ImageDraw
+
+from wifiqr.generator import (
+    WiFiQRGenerator,
+    _cached_image,
+    _encode_qr_matrix,
+    _load_font,
+    _matrix_to_image,
+    _render_text_mask,
+    generate_many,
+    generate_wifi_qr,
+    main,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Reset module-level caches so mocks don't leak between tests."""
+    _load_font.cache_clear()
+    _cached_image.cache_clear()
+    _render_text_mask.cache_clear()
+    yield
+    _load_font.cache_clear()
+    _cached_image.cache_clear()
+    _render_text_mask.cache_clear()
 
 
 class TestMainCLI:
@@ -38,6 +62,7 @@ class TestMainCLI:
         """Test successful execution with environment variables."""
         mock_generator_instance = MagicMock()
         mock_generator_instance.create_image.return_value = mock_qr_image
+        mock_generator_instance.save_image.return_value = "JPEG"
         mock_wifi_qr_generator.return_value = mock_generator_instance
 
         with patch.dict(os.environ, env_vars):
@@ -50,17 +75,18 @@ class TestMainCLI:
         )
         mock_generator_instance.create_image.assert_called_once()
         mock_generator_instance.save_image.assert_called_once_with(
-            mock_qr_image, "test.jpg"
+            mock_qr_image, "test.jpg", None
         )
 
     @patch("wifiqr.generator.WiFiQRGenerator")
-    @patch("wifiqr.generator.load_dotenv")
+    @patch("dotenv.load_dotenv")
     def test_main_with_cli_options_success(
         self, mock_load_dotenv, mock_wifi_qr_generator, runner, mock_qr_image
     ):
         """Test successful execution with CLI options."""
         mock_generator_instance = MagicMock()
         mock_generator_instance.create_image.return_value = mock_qr_image
+        mock_generator_instance.save_image.return_value = "JPEG"
         mock_wifi_qr_generator.return_value = mock_generator_instance
 
         result = runner.invoke(
@@ -84,10 +110,48 @@ class TestMainCLI:
         )
         mock_generator_instance.create_image.assert_called_once()
         mock_generator_instance.save_image.assert_called_once_with(
-            mock_qr_image, "test.jpg"
+            mock_qr_image, "test.jpg", None
+        )
+
+    @patch("wifiqr.generator.WiFiQRGenerator")
+    @patch("dotenv.load_dotenv")
+    def test_main_png_output(
+        self, mock_load_dotenv, mock_wifi_qr_generator, runner, mock_qr_image, env_vars
+    ):
+        """Test the CLI reports the format save_image inferred from the suffix."""
+        mock_generator_instance = MagicMock()
+        mock_generator_instance.create_image.return_value = mock_qr_image
+        mock_generator_instance.save_image.return_value = "PNG"
+        mock_wifi_qr_generator.return_value = mock_generator_instance
+
+        with patch.dict(os.environ, env_vars):
+            result = runner.invoke(main, ["--output", "test.png"])
+
+        assert result.exit_code == 0
+        assert "PNG saved to test.png" in result.output
+        mock_generator_instance.save_image.assert_called_once_with(
+            mock_qr_image, "test.png", None
         )
 
-    @patch("wifiqr.generator.load_dotenv")
+    @patch("wifiqr.generator.WiFiQRGenerator")
+    @patch("dotenv.load_dotenv")
+    def test_main_format_option_overrides_suffix(
+        self, mock_load_dotenv, mock_wifi_qr_generator, runner, mock_qr_image, env_vars
+    ):
+        """Test --format takes precedence over the output suffix."""
+        mock_generator_instance = MagicMock()
+        mock_generator_instance.create_image.return_value = mock_qr_image
+        mock_wifi_qr_generator.return_value = mock_generator_instance
+
+        with patch.dict(os.environ, env_vars):
+            result = runner.invoke(main, ["--output", "wifi.out", "--format", "png"])
+
+        assert result.exit_code == 0
+        mock_generator_instance.save_image.assert_called_once_with(
+            mock_qr_image, "wifi.out", "PNG"
+        )
+
+    @patch("dotenv.load_dotenv")
     def test_main_missing_ssid_error(self, mock_load_dotenv, runner):
         """Test error when SSID is missing."""
         env_vars = {"WIFI_PASSWORD": "test_password"}
@@ -98,7 +162,7 @@ class TestMainCLI:
         assert result.exit_code == 1
         assert "SSID is required" in result.output
 
-    @patch("wifiqr.generator.load_dotenv")
+    @patch("dotenv.load_dotenv")
     def test_main_missing_password_error(self, mock_load_dotenv, runner):
         """Test error when password is missing."""
         env_vars = {"WIFI_SSID": "test_network"}
@@ -109,7 +173,7 @@ class TestMainCLI:
         assert result.exit_code == 1
         assert "Password is required" in result.output
 
-    @patch("wifiqr.generator.load_dotenv")
+    @patch("dotenv.load_dotenv")
     def test_main_invalid_encryption_error(self, mock_load_dotenv, runner):
         """Test error when encryption type is invalid."""
         env_vars = {"WIFI_SSID": "test_network", "WIFI_PASSWORD": "test_password"}
@@ -124,7 +188,7 @@ class TestMainCLI:
         assert "WPA, WEP, nopass" in result.output
 
     @patch("wifiqr.generator.WiFiQRGenerator")
-    @patch("wifiqr.generator.load_dotenv")
+    @patch("dotenv.load_dotenv")
     def test_main_generate_wifi_qr_error(
         self, mock_load_dotenv, mock_wifi_qr_generator, runner
     ):
@@ -140,7 +204,7 @@ class TestMainCLI:
         assert "QR generation failed" in result.output
 
     @patch("wifiqr.generator.WiFiQRGenerator")
-    @patch("wifiqr.generator.load_dotenv")
+    @patch("dotenv.load_dotenv")
     def test_main_default_encryption_wpa(
         self, mock_load_dotenv, mock_wifi_qr_generator, runner, mock_qr_image
     ):
@@ -160,7 +224,7 @@ class TestMainCLI:
         )
 
     @patch("wifiqr.generator.WiFiQRGenerator")
-    @patch("wifiqr.generator.load_dotenv")
+    @patch("dotenv.load_dotenv")
     def test_main_cli_overrides_env_vars(
         self, mock_load_dotenv, mock_wifi_qr_generator, runner, mock_qr_image
     ):
@@ -196,7 +260,7 @@ class TestMainCLI:
         )
 
     @patch("wifiqr.generator.WiFiQRGenerator")
-    @patch("wifiqr.generator.load_dotenv")
+    @patch("dotenv.load_dotenv")
     def test_main_partial_cli_options(
         self, mock_load_dotenv, mock_wifi_qr_generator, runner, mock_qr_image
     ):
@@ -218,7 +282,7 @@ class TestMainCLI:
         )
 
     @patch("wifiqr.generator.WiFiQRGenerator")
-    @patch("wifiqr.generator.load_dotenv")
+    @patch("dotenv.load_dotenv")
     def test_main_nopass_encryption(
         self, mock_load_dotenv, mock_wifi_qr_generator, runner, mock_qr_image
     ):
@@ -252,9 +316,7 @@ class TestWiFiQRGenerator:
     def mock_qr_code(self):
         """Mock QR code fixture."""
         mock_qr = MagicMock()
-        mock_img = MagicMock()
-        mock_img.size = (400, 400)
-        mock_qr.make_image.return_value = mock_img
+        mock_qr.get_matrix.return_value = [[True]]
         return mock_qr
 
     @pytest.fixture
@@ -303,6 +365,17 @@ class TestWiFiQRGenerator:
         assert generator.password is None
         assert generator.encryption == "nopass"
 
+    def test_credentials_read_only(self):
+        """Test credentials cannot drift from the precomputed payload."""
+        generator = WiFiQRGenerator("test_ssid", "test_password", "WPA")
+
+        with pytest.raises(AttributeError):
+            generator.ssid = "other_ssid"
+
+        assert generator.encode_wifi_string() == (
+            "WIFI:S:test_ssid;T:WPA;P:test_password;;"
+        )
+
     def test_encode_wifi_string_wpa(self):
         """Test WiFi string encoding for WPA."""
         generator = WiFiQRGenerator("test_ssid", "test_password", "WPA")
@@ -326,10 +399,10 @@ class TestWiFiQRGenerator:
         generator = WiFiQRGenerator("test_ssid", "test_password", "WPA")
         result = generator.generate_text_overlay(20, 400)
 
-        expected = [
+        expected = (
             ((90, 380), "ssid: test_ssid"),
             ((90, 430), "password: test_password"),
-        ]
+        )
         assert result == expected
 
     def test_generate_text_overlay_nopass(self):
@@ -337,48 +410,146 @@ class TestWiFiQRGenerator:
         generator = WiFiQRGenerator("open_ssid", None, "nopass")
         result = generator.generate_text_overlay(20, 400)
 
-        expected = [
+        expected = (
             ((90, 380), "ssid: open_ssid"),
             ((90, 430), "password: (no password)"),
-        ]
+        )
         assert result == expected
 
-    @patch("wifiqr.generator.Image.new")
-    @patch("wifiqr.generator.ImageDraw.Draw")
-    @patch("wifiqr.generator.ImageFont.truetype")
-    @patch("wifiqr.generator.qrcode.QRCode")
+    @patch("wifiqr.generator._blank_canvas")
+    @patch("wifiqr.generator._render_text_mask")
+    @patch("wifiqr.generator._matrix_to_image")
+    @patch("qrcode.QRCode")
     def test_create_image_success(
         self,
         mock_qr_code_class,
-        mock_truetype,
-        mock_draw,
-        mock_image_new,
+        mock_matrix_to_image,
+        mock_render_text_mask,
+        mock_blank_canvas,
         mock_qr_code,
         mock_pil_image,
     ):
         """Test successful image creation."""
         mock_qr_code_class.return_value = mock_qr_code
-        mock_image_new.return_value = mock_pil_image
-        mock_truetype.return_value = MagicMock()
-        mock_draw.return_value = MagicMock()
+        mock_matrix_to_image.return_value = MagicMock(size=(400, 400))
+        mock_blank_canvas.return_value.copy.return_value = mock_pil_image
+        mock_mask = MagicMock()
+        mock_render_text_mask.return_value = (mock_mask, (1, 2))
 
         generator = WiFiQRGenerator("test_ssid", "test_password", "WPA")
         result = generator.create_image()
 
         # Verify QR code creation
-        mock_qr_code_class.assert_called_once_with(box_size=22, border=4)
+        mock_qr_code_class.assert_called_once_with(border=0, mask_pattern=0)
         mock_qr_code.add_data.assert_called_once_with(
             "WIFI:S:test_ssid;T:WPA;P:test_password;;"
         )
         mock_qr_code.make.assert_called_once_with(fit=True)
-        mock_qr_code.make_image.assert_called_once()
+        mock_matrix_to_image.assert_called_once_with([[True]], box_size=22)
+
+        # Verify canvas creation; a 1x1 matrix plus 4-module quiet zone is
+        # 198px square, centered horizontally and offset by the border
+        mock_blank_canvas.return_value.copy.assert_called_once_with()
+        mock_pil_image.paste.assert_any_call(
+            mock_matrix_to_image.return_value, (402, 108)
+        )
+
+        # Verify text masks are pasted below the QR code, offset by their bbox
+        mock_render_text_mask.assert_any_call("ssid: test_ssid", generator._get_font())
+        mock_pil_image.paste.assert_any_call("black", (91, 180), mock_mask)
+        mock_pil_image.paste.assert_any_call("black", (91, 230), mock_mask)
+
+        assert result == mock_pil_image.copy.return_value
+
+    def test_encode_qr_matrix_uses_numeric_segments(self):
+        """Test long digit runs are segmented so the code stays on the canvas."""
+        generator = WiFiQRGenerator("Home12345", "123456789012345678901234")
+
+        matrix = _encode_qr_matrix(generator.encode_wifi_string())
+
+        # 22px modules plus a 4-module quiet zone on each side
+        assert (len(matrix) + 8) * 22 <= generator.create_image().width
+
+    @patch("wifiqr.generator._encode_qr_matrix")
+    def test_create_image_cached(self, mock_encode_qr_matrix):
+        """Test repeated renders reuse the cache and return independent copies."""
+        mock_encode_qr_matrix.return_value = [[1, 0], [0, 1]]
+
+        first = WiFiQRGenerator("test_ssid", "test_password", "WPA").create_image()
+        second = WiFiQRGenerator("test_ssid", "test_password", "WPA").create_image()
 
-        # Verify canvas creation
-        mock_image_new.assert_called_once_with("RGB", (827, 920), "white")
+        mock_encode_qr_matrix.assert_called_once()
+        assert first is not second
+        assert first.tobytes() == second.tobytes()
 
-        assert result == mock_pil_image
+    def test_render_text_mask_matches_draw_text(self):
+        """Test pasting a cached text mask is pixel-identical to draw.text."""
+        generator = WiFiQRGenerator("test_ssid", "test_password", "WPA")
+        expected = Image.new("RGB", (827, 920), "white")
+        draw = ImageDraw.Draw(expected)
+        for position, text in generator.generate_text_overlay(20, 400):
+            draw.text(position, text, fill="black", font=generator._get_font())
+
+        canvas = Image.new("RGB", (827, 920), "white")
+        generator._add_text_to_canvas(canvas, 20, 400)
+
+        assert canvas.tobytes() == expected.tobytes()
+
+    @patch("wifiqr.generator._render_text_mask")
+    def test_add_text_to_canvas_uses_get_font(self, mock_render_text_mask):
+        """Test text masks are rendered with the font _get_font returns."""
+        mock_render_text_mask.return_value = (MagicMock(), (0, 0))
+        custom_font = MagicMock()
+
+        generator = WiFiQRGenerator("test_ssid", "test_password", "WPA")
+        with patch.object(generator, "_get_font", return_value=custom_font):
+            generator._add_text_to_canvas(MagicMock(), 20, 400)
+
+        mock_render_text_mask.assert_any_call("ssid: test_ssid", custom_font)
+        mock_render_text_mask.assert_any_call("password: test_password", custom_font)
+
+    def test_create_image_subclass_not_served_base_cache(self):
+        """Test a subclass with its own layout is not given the base rendering."""
+
+        class ShiftedTextGenerator(WiFiQRGenerator):
+            FONT_SIZE = 20
+
+            def generate_text_overlay(self, qr_y_position, qr_height):
+                return (((10, 10), self.ssid),)
+
+        base = WiFiQRGenerator("test_ssid", "test_password", "WPA").create_image()
+        custom = ShiftedTextGenerator(
+            "test_ssid", "test_password", "WPA"
+        ).create_image()
+        expected = ShiftedTextGenerator("test_ssid", "test_password", "WPA")._render()
+
+        assert custom.tobytes() != base.tobytes()
+        assert custom.tobytes() == expected.tobytes()
+
+    def test_create_image_instance_override_not_served_cache(self):
+        """Test an instance with an overridden method renders with it."""
+        base = WiFiQRGenerator("test_ssid", "test_password", "WPA").create_image()
+        generator = WiFiQRGenerator("test_ssid", "test_password", "WPA")
+        generator.generate_text_overlay = MagicMock(
+            return_value=(((10, 10), "custom"),)
+        )
 
-    @patch("wifiqr.generator.ImageFont.truetype")
+        custom = generator.create_image()
+
+        assert custom.tobytes() != base.tobytes()
+        assert custom.tobytes() == generator._render().tobytes()
+
+    def test_matrix_to_image(self):
+        """Test module matrix rasterization with box size."""
+        image = _matrix_to_image([[True, False], [False, True]], box_size=2)
+
+        assert image.mode == "L"
+        assert image.size == (4, 4)
+        # dark, dark, light, dark modules
+        pixels = [image.getpixel(xy) for xy in [(0, 0), (1, 1), (3, 1), (3, 3)]]
+        assert pixels == [0, 0, 255, 0]
+
+    @patch("PIL.ImageFont.truetype")
     def test_get_font_success(self, mock_truetype):
         """Test successful font loading."""
         mock_truetype.return_value = MagicMock()
@@ -389,8 +560,8 @@ class TestWiFiQRGenerator:
         mock_truetype.assert_called_once_with("/System/Library/Fonts/Arial.ttf", 40)
         assert font == mock_truetype.return_value
 
-    @patch("wifiqr.generator.ImageFont.truetype")
-    @patch("wifiqr.generator.ImageFont.load_default")
+    @patch("PIL.ImageFont.truetype")
+    @patch("PIL.ImageFont.load_default")
     def test_get_font_fallback(self, mock_load_default, mock_truetype):
         """Test font fallback when Arial is not available."""
         mock_truetype.side_effect = OSError("Font not found")
@@ -403,40 +574,185 @@ class TestWiFiQRGenerator:
         mock_load_default.assert_called_once()
         assert font == mock_load_default.return_value
 
-    def test_save_image(self):
+    @patch("PIL.ImageFont.truetype")
+    def test_get_font_cached(self, mock_truetype):
+        """Test the font is parsed once and reused across generators."""
+        mock_truetype.return_value = MagicMock()
+
+        first = WiFiQRGenerator("test_ssid", "test_password", "WPA")._get_font()
+        second = WiFiQRGenerator("other_ssid", "other_password", "WPA")._get_font()
+
+        mock_truetype.assert_called_once_with("/System/Library/Fonts/Arial.ttf", 40)
+        assert first is second
+
+    def test_save_image(self, tmp_path):
         """Test image saving."""
         mock_image = MagicMock()
+        output_path = tmp_path / "test_output.jpg"
 
         generator = WiFiQRGenerator("test_ssid", "test_password", "WPA")
-        generator.save_image(mock_image, "test_output.jpg")
+        generator.save_image(mock_image, str(output_path))
+
+        mock_image.convert.assert_called_once_with("L")
+        mock_save = mock_image.convert.return_value.save
+        mock_save.assert_called_once_with(
+            ANY, "JPEG", quality=85, optimize=False, progressive=False
+        )
+        assert mock_save.call_args.args[0].name == str(output_path)
+
+    def test_save_image_png(self, tmp_path):
+        """Test PNG saving is selected from the output suffix."""
+        mock_image = MagicMock()
+        output_path = tmp_path / "test_output.PNG"
 
-        mock_image.save.assert_called_once_with("test_output.jpg", "JPEG")
+        generator = WiFiQRGenerator("test_ssid", "test_password", "WPA")
+        saved_format = generator.save_image(mock_image, str(output_path))
+
+        mock_image.convert.return_value.save.assert_called_once_with(
+            ANY, "PNG", optimize=False, compress_level=1
+        )
+        assert saved_format == "PNG"
+
+    def test_save_image_format_case_insensitive(self, tmp_path):
+        """Test a lowercase format still selects the PNG encoder."""
+        mock_image = MagicMock()
+
+        generator = WiFiQRGenerator("test_ssid", "test_password", "WPA")
+        generator.save_image(mock_image, str(tmp_path / "test_output.png"), "png")
+
+        mock_image.convert.return_value.save.assert_called_once_with(
+            ANY, "PNG", optimize=False, compress_level=1
+        )
+
+    def test_save_image_invalid_format(self, tmp_path):
+        """Test an unknown format raises before any file is created."""
+        mock_image = MagicMock()
+        output_path = tmp_path / "test_output.gif"
+
+        generator = WiFiQRGenerator("test_ssid", "test_password", "WPA")
+        with pytest.raises(ValueError, match="Invalid image format 'GIF'"):
+            generator.save_image(mock_image, str(output_path), "gif")
+
+        mock_image.convert.assert_not_called()
+        assert not output_path.exists()
+
+    def test_save_image_file_object(self):
+        """Test saving into an in-memory file object."""
+        generator = WiFiQRGenerator("test_ssid", "test_password", "WPA")
+        buffer = io.BytesIO()
+
+        generator.save_image(generator.create_image(), buffer, "PNG")
+
+        buffer.seek(0)
+        with Image.open(buffer) as image:
+            assert image.format == "PNG"
+            assert image.size == (827, 920)
+
+    def test_save_image_removes_partial_file(self, tmp_path):
+        """Test a failed encode does not leave a truncated file behind."""
+        mock_image = MagicMock()
+        mock_image.convert.return_value.save.side_effect = OSError("disk full")
+        output_path = tmp_path / "test_output.jpg"
+
+        generator = WiFiQRGenerator("test_ssid", "test_password", "WPA")
+        with pytest.raises(OSError, match="disk full"):
+            generator.save_image(mock_image, str(output_path))
+
+        assert not output_path.exists()
+
+    def test_save_image_open_failure_keeps_existing_file(self, tmp_path):
+        """Test a file that cannot be opened for writing is left in place."""
+        output_path = tmp_path / "test_output.jpg"
+        output_path.write_bytes(b"existing")
+
+        generator = WiFiQRGenerator("test_ssid", "test_password", "WPA")
+        with (
+            patch("pathlib.Path.open", side_effect=PermissionError("denied")),
+            pytest.raises(PermissionError, match="denied"),
+        ):
+            generator.save_image(MagicMock(), str(output_path))
+
+        assert output_path.read_bytes() == b"existing"
 
 
 class TestGenerateWifiQR:
     """Test class for the legacy generate_wifi_qr function."""
 
-    @patch("wifiqr.generator.Image.new")
-    @patch("wifiqr.generator.ImageDraw.Draw")
-    @patch("wifiqr.generator.ImageFont.truetype")
-    @patch("wifiqr.generator.qrcode.QRCode")
+    @patch("wifiqr.generator._blank_canvas")
+    @patch("wifiqr.generator._render_text_mask")
+    @patch("wifiqr.generator._matrix_to_image")
+    @patch("qrcode.QRCode")
     def test_legacy_function_backward_compatibility(
-        self, mock_qr_code_class, mock_truetype, mock_draw, mock_image_new
+        self,
+        mock_qr_code_class,
+        mock_matrix_to_image,
+        mock_render_text_mask,
+        mock_blank_canvas,
     ):
         """Test that legacy function still works for backward compatibility."""
         mock_qr_code = MagicMock()
-        mock_qr_img = MagicMock()
-        mock_qr_img.size = (400, 400)
-        mock_qr_code.make_image.return_value = mock_qr_img
+        mock_matrix_to_image.return_value = MagicMock(size=(400, 400))
         mock_pil_image = MagicMock()
         mock_qr_code_class.return_value = mock_qr_code
-        mock_image_new.return_value = mock_pil_image
-        mock_truetype.return_value = MagicMock()
-        mock_draw.return_value = MagicMock()
+        mock_blank_canvas.return_value.copy.return_value = mock_pil_image
+        mock_mask = MagicMock()
+        mock_render_text_mask.return_value = (mock_mask, (1, 2))
 
         result = generate_wifi_qr("test_ssid", "test_password", "WPA")
 
         mock_qr_code.add_data.assert_called_once_with(
             "WIFI:S:test_ssid;T:WPA;P:test_password;;"
         )
-        assert result == mock_pil_image
+        assert result == mock_pil_image.copy.return_value
+
+
+class TestGenerateMany:
+    """Test class for the generate_many batch function."""
+
+    def test_generate_many(self):
+        """Test a batch renders in-process by default, one image per credentials."""
+        credentials = [
+            ("first_ssid", "first_password", "WPA"),
+            ("open_ssid", None, "nopass"),
+        ]
+
+        with patch("concurrent.futures.ProcessPoolExecutor") as mock_executor:
+            result = generate_many(credentials)
+
+        mock_executor.assert_not_called()
+        assert len(result) == len(credentials)
+        for image, creds in zip(result, credentials, strict=True):
+            assert image.tobytes() == generate_wifi_qr(*creds).tobytes()
+
+    def test_generate_many_process_pool(self):
+        """Test a batch spread over worker processes keeps input order."""
+        credentials = [(f"ssid_{i}", f"password_{i}", "WPA") for i in range(3)]
+
+        result = generate_many(credentials, max_workers=2)
+
+        for image, creds in zip(result, credentials, strict=True):
+            assert image.tobytes() == generate_wifi_qr(*creds).tobytes()
+
+    def test_generate_many_max_workers_none(self):
+        """Test max_workers=None sizes the pool to the CPU count."""
+        credentials = [(f"ssid_{i}", f"password_{i}", "WPA") for i in range(3)]
+
+        with (
+            patch("os.cpu_count", return_value=2),
+            patch("concurrent.futures.ProcessPoolExecutor") as mock_executor,
+        ):
+            generate_many(credentials, max_workers=None)
+
+        mock_executor.assert_called_once_with(max_workers=2)
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_generate_many_invalid_credentials(self, max_workers):
+        """Test invalid credentials in a batch raise ValueError."""
+        credentials = [("ssid", "password", "WPA"), ("", "password", "WPA")]
+
+        with pytest.raises(ValueError, match="SSID must be provided"):
+            generate_many(credentials, max_workers=max_workers)
+
+    def test_generate_many_empty(self):
+        """Test an empty batch returns an empty list."""
+        assert generate_many([]) == []
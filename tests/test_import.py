@@ -1,2 +1,16 @@
+import subprocess
+import sys
+
+
 def test_import():
     pass
+
+
+def test_import_defers_heavy_dependencies():
+    """Test importing the package does not load heavy dependencies."""
+    deferred = ("PIL", "qrcode", "dotenv", "multiprocessing")
+    code = f"import sys, wifiqr; print([m for m in {deferred!r} if m in sys.modules])"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"